@@ -42,11 +42,24 @@ Usage:
 Requirements:
     pip install kicad-sch-api
     KiCad 9+ installed (for SVG rendering via kicad-cli)
+
+Optional accelerators (auto-detected, pure-Python fallbacks otherwise):
+    pip install pyahocorasick  # one-pass signal type matching
+    pip install numpy          # vectorized layout + connection tables
+    pip install scipy          # bulk wire routing (shared obstacle index)
+    pip install numba          # JIT-compiled layout kernel
 """
 
+import functools
+import io
 import subprocess
 import os
 import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import chain
 from typing import Dict, List, Tuple, Optional, Any
 
 try:
@@ -55,6 +68,26 @@ except ImportError:
     ksa = None
     print("Warning: kicad-sch-api not installed. Run: pip install kicad-sch-api")
 
+try:
+    import ahocorasick  # optional: fast multi-keyword matching for signal inference
+except ImportError:
+    ahocorasick = None
+
+try:
+    import numpy as np  # optional: vectorized auto-layout math
+except ImportError:
+    np = None
+
+try:
+    from scipy.spatial import cKDTree  # optional: shared obstacle index for routing
+except ImportError:
+    cKDTree = None
+
+try:
+    import numba  # optional: JIT-compiled layout kernel
+except ImportError:
+    numba = None
+
 
 # Grid spacing in KiCad (mm)
 GRID_SPACING = 2.54
@@ -64,6 +97,92 @@ COMPONENT_SPACING_Y = 10.0  # Vertical spacing between pins
 # Default output directory (relative to current working directory)
 DEFAULT_OUTPUT_DIR = "KiCad"
 
+# Layout classification: str.startswith accepts a tuple natively, so these
+# are built once instead of allocating per-component strings in the loop
+_MCU_TOKENS = ('MCU', 'Module', 'IC')
+_PASSIVE_PREFIXES = ('Device:R', 'Device:C', 'Device:L')
+
+# Schematics waiting for a batched SVG render (see kicad_batch)
+_PENDING_SVG: List[str] = []
+_BATCH_STATE = threading.local()
+
+
+def _batch_active() -> bool:
+    """Check whether the calling thread is inside a kicad_batch() block."""
+    return getattr(_BATCH_STATE, 'active', False)
+
+
+@contextmanager
+def kicad_batch():
+    """
+    Defer SVG rendering for all schematics created inside this block.
+
+    kicad-cli startup costs hundreds of milliseconds per invocation, so
+    rendering many schematics one at a time is dominated by process spawn.
+    Inside this context manager, create_schematic() queues its output file
+    instead of rendering immediately; on exit, flush_svg_renders() renders
+    all queued files with one kicad-cli call per output directory.
+
+    Example:
+        with kicad_batch():
+            create_schematic(..., filename='a.kicad_sch')
+            create_schematic(..., filename='b.kicad_sch')
+        # Both SVGs rendered here with a single kicad-cli invocation
+    """
+    _BATCH_STATE.active = True
+    try:
+        yield
+    finally:
+        _BATCH_STATE.active = False
+        flush_svg_renders()
+
+
+def flush_svg_renders() -> List[str]:
+    """
+    Render all deferred schematics, grouped into one kicad-cli call per
+    output directory.
+
+    Returns:
+        List of SVG paths that were rendered successfully
+    """
+    pending = list(_PENDING_SVG)
+    _PENDING_SVG.clear()
+
+    by_dir: Dict[str, List[str]] = {}
+    for sch_path in pending:
+        by_dir.setdefault(os.path.dirname(sch_path) or '.', []).append(sch_path)
+
+    rendered = []
+    for output_dir, sch_paths in by_dir.items():
+        try:
+            # Output is discarded either way; failures re-render per file
+            # below, which reports diagnostics
+            result = subprocess.run(
+                ['kicad-cli', 'sch', 'export', 'svg', '-o', output_dir] + sch_paths,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30 * len(sch_paths)
+            )
+            batch_ok = result.returncode == 0
+        except Exception:
+            batch_ok = False
+
+        for sch_path in sch_paths:
+            if batch_ok:
+                svg_path = _collect_svg(sch_path)
+            else:
+                # Fall back to the single-file path for better diagnostics
+                svg_path = _render_svg(sch_path)
+            if svg_path:
+                print(f"Rendered: {svg_path}")
+                rendered.append(svg_path)
+
+    return rendered
+
+
+# Directories already created by _get_output_path, to skip repeat syscalls
+_DIR_CACHE: set = set()
+
 
 def _get_output_path(filename: str, output_dir: Optional[str] = None) -> str:
     """
@@ -80,11 +199,13 @@ def _get_output_path(filename: str, output_dir: Optional[str] = None) -> str:
         dir_path = output_dir or DEFAULT_OUTPUT_DIR
         output_path = os.path.join(dir_path, filename)
 
-    # Create directory if it doesn't exist
+    # Create directory if it doesn't exist (once per directory per run)
     dir_path = os.path.dirname(output_path)
-    if dir_path and not os.path.exists(dir_path):
-        os.makedirs(dir_path)
-        print(f"Created directory: {dir_path}")
+    if dir_path and dir_path not in _DIR_CACHE:
+        if not os.path.isdir(dir_path):
+            os.makedirs(dir_path, exist_ok=True)
+            print(f"Created directory: {dir_path}")
+        _DIR_CACHE.add(dir_path)
 
     return output_path
 
@@ -102,6 +223,33 @@ def _snap_to_grid(value: float, grid: float = GRID_SPACING) -> float:
     return round(value / grid) * grid
 
 
+@dataclass(slots=True)
+class ComponentSpec:
+    """
+    Normalized component definition used internally by create_schematic.
+
+    The public API still accepts plain dicts; they are converted once at
+    entry so the layout, wiring, and documentation passes use fast slot
+    attribute access instead of repeated dict.get() calls.
+    """
+    lib_id: str = 'Device:R'
+    value: str = ''
+    footprint: str = ''
+    pins: Dict[str, str] = field(default_factory=dict)
+    position: Optional[Tuple[float, float]] = None
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> 'ComponentSpec':
+        """Build a ComponentSpec from a user-supplied dict, ignoring unknown keys."""
+        return cls(
+            lib_id=spec.get('lib_id', 'Device:R'),
+            value=spec.get('value', ''),
+            footprint=spec.get('footprint', ''),
+            pins=spec.get('pins', {}),
+            position=spec.get('position'),
+        )
+
+
 def create_schematic(
     components: Dict[str, Dict[str, Any]],
     connections: List[Tuple[str, str]],
@@ -111,6 +259,7 @@ def create_schematic(
     render_svg: bool = True,
     auto_layout: bool = True,
     output_dir: Optional[str] = None,
+    defer_render: bool = False,
 ) -> str:
     """
     Create a KiCad schematic from components and connections.
@@ -141,6 +290,10 @@ def create_schematic(
 
         output_dir: Output directory for files (default: ./KiCad/)
 
+        defer_render: If True, queue the SVG render for flush_svg_renders()
+            instead of rendering immediately. Defaults to deferred inside a
+            `with kicad_batch():` block.
+
     Returns:
         Path to the created schematic file
 
@@ -160,23 +313,31 @@ def create_schematic(
     # Resolve output path
     filename = _get_output_path(filename, output_dir)
 
+    # Normalize user dicts once; everything downstream uses slot attributes
+    specs = {ref: ComponentSpec.from_dict(spec) for ref, spec in components.items()}
+
     # Create new schematic
     sch = ksa.create_schematic(title or "Schematic")
 
     # Calculate component positions if auto_layout enabled
     positions = {}
     if auto_layout:
-        positions = _auto_layout_components(components)
-
-    # Add components
-    for ref, spec in components.items():
-        lib_id = spec.get('lib_id', 'Device:R')
-        value = spec.get('value', '')
-        footprint = spec.get('footprint', '')
-
+        if np is not None and connections and len(specs) <= _FR_MAX_COMPONENTS:
+            # Connection-aware layout keeps connected components close,
+            # which greatly reduces routing work later
+            positions = _fr_layout(specs, connections)
+        else:
+            positions = _auto_layout_components(specs)
+
+    # Add components, collecting the flat (ref.pin_name) ->
+    # (ref, pin_number) map and the positions actually used (explicit
+    # placements override the layout) in the same pass
+    flat_pins = {}
+    placed = {}
+    for ref, spec in specs.items():
         # Get position
-        if 'position' in spec:
-            pos = spec['position']
+        if spec.position is not None:
+            pos = spec.position
         elif ref in positions:
             pos = positions[ref]
         else:
@@ -184,36 +345,51 @@ def create_schematic(
 
         # Snap to grid
         pos = (_snap_to_grid(pos[0]), _snap_to_grid(pos[1]))
+        placed[ref] = pos
 
         try:
             sch.components.add(
-                lib_id=lib_id,
+                lib_id=spec.lib_id,
                 reference=ref,
-                value=value,
+                value=spec.value,
                 position=pos,
-                footprint=footprint if footprint else None
+                footprint=spec.footprint if spec.footprint else None
             )
         except Exception as e:
-            print(f"Warning: Could not add component {ref} ({lib_id}): {e}")
+            print(f"Warning: Could not add component {ref} ({spec.lib_id}): {e}")
 
-    # Create pin name to number mapping for each component
-    pin_maps = {}
-    for ref, spec in components.items():
-        if 'pins' in spec:
-            pin_maps[ref] = spec['pins']
-        else:
-            pin_maps[ref] = {}
+        for name, num in spec.pins.items():
+            flat_pins[f'{ref}.{name}'] = (ref, str(num))
 
-    # Add wire connections
-    for conn in connections:
-        src, dst = conn
+    # Resolve every unique pin reference once; the same ref often appears
+    # in connections, power_connections, and label positioning
+    resolved = {}
+    all_pin_refs = chain(
+        (p for conn in connections for p in conn),
+        (p for pin_list, _ in (power_connections or []) for p in pin_list),
+    )
+    for pin_ref in all_pin_refs:
+        if pin_ref in resolved:
+            continue
         try:
-            src_ref, src_pin = _parse_pin_ref(src, pin_maps)
-            dst_ref, dst_pin = _parse_pin_ref(dst, pin_maps)
+            resolved[pin_ref] = _parse_pin_ref(pin_ref, flat_pins)
         except Exception as e:
-            print(f"Warning: Could not parse pin reference {src} or {dst}: {e}")
-            continue
+            print(f"Warning: Could not parse pin reference {pin_ref}: {e}")
+            resolved[pin_ref] = None
 
+    # Add wire connections
+    pending = [
+        (src, dst, resolved[src], resolved[dst])
+        for src, dst in connections
+        if resolved[src] is not None and resolved[dst] is not None
+    ]
+
+    # Bulk-route against a single obstacle index when scipy is available;
+    # auto_route_pins rebuilds its obstacle map on every call
+    if np is not None and cKDTree is not None and placed:
+        pending = _route_all(sch, pending, placed)
+
+    for src, dst, (src_ref, src_pin), (dst_ref, dst_pin) in pending:
         try:
             # Use auto_route_pins for manhattan routing with obstacle avoidance
             sch.auto_route_pins(
@@ -232,21 +408,25 @@ def create_schematic(
     # Add power connections with labels
     if power_connections:
         for pin_list, net_name in power_connections:
-            _add_power_net(sch, pin_list, net_name, pin_maps)
+            _add_power_net(sch, pin_list, net_name, resolved)
 
     # Save schematic
     sch.save(filename)
     print(f"Saved: {filename}")
 
-    # Render SVG if requested
+    # Render SVG if requested (deferred renders are batched to amortize
+    # kicad-cli startup cost across schematics)
     if render_svg:
-        svg_path = _render_svg(filename)
-        if svg_path:
-            print(f"Rendered: {svg_path}")
+        if defer_render or _batch_active():
+            _PENDING_SVG.append(filename)
+        else:
+            svg_path = _render_svg(filename)
+            if svg_path:
+                print(f"Rendered: {svg_path}")
 
     # Generate connection table markdown
     md_path = _generate_connection_md(
-        filename, title, components, connections, power_connections
+        filename, title, specs, connections, power_connections
     )
     if md_path:
         print(f"Documentation: {md_path}")
@@ -254,34 +434,80 @@ def create_schematic(
     return filename
 
 
-def _parse_pin_ref(pin_ref: str, pin_maps: Dict[str, Dict[str, str]]) -> Tuple[str, str]:
+def _create_one(spec: Dict[str, Any]) -> str:
+    """
+    Worker for create_schematics_batch: build one schematic, deferring SVG
+    rendering to the parent process.
+    """
+    spec = dict(spec)
+    spec['render_svg'] = False
+    return create_schematic(**spec)
+
+
+def create_schematics_batch(
+    specs: List[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+    render_svg: bool = True,
+) -> List[str]:
+    """
+    Create many schematics in parallel across a process pool.
+
+    Schematic construction is CPU-bound (serialization plus layout and
+    routing) and each schematic is independent, so dispatching them to
+    worker processes scales with available cores. SVG rendering happens
+    afterwards in the parent process with one batched kicad-cli call per
+    output directory (see flush_svg_renders), so worker results are not
+    blocked behind subprocess spawns.
+
+    Args:
+        specs: List of create_schematic keyword-argument dicts
+        max_workers: Process pool size (default: number of CPUs)
+        render_svg: If True, render all SVGs once building finishes.
+            Entries with their own `render_svg: False` are skipped.
+
+    Returns:
+        List of schematic paths, in the same order as `specs`
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        paths = list(executor.map(_create_one, specs))
+
+    if render_svg:
+        _PENDING_SVG.extend(
+            path for spec, path in zip(specs, paths)
+            if spec.get('render_svg', True)
+        )
+        flush_svg_renders()
+
+    return paths
+
+
+def _parse_pin_ref(pin_ref: str, flat_pins: Dict[str, Tuple[str, str]]) -> Tuple[str, str]:
     """
     Parse a pin reference like 'U1.TX1' into (reference, pin_number).
 
     Args:
         pin_ref: Pin reference string (e.g., 'U1.TX1', 'R1.2')
-        pin_maps: Dict mapping component refs to pin name->number mappings
+        flat_pins: Dict mapping full pin references to pre-split
+            (reference, pin_number) tuples
 
     Returns:
         Tuple of (reference_designator, pin_number)
     """
+    # Single hash lookup covers the common case of a mapped pin name
+    hit = flat_pins.get(pin_ref)
+    if hit is not None:
+        return hit
+
     parts = pin_ref.split('.')
     if len(parts) != 2:
         raise ValueError(f"Invalid pin reference: {pin_ref}")
 
     ref, pin_name = parts
+    # Assume pin_name is already the pin number
+    return ref, str(pin_name)
 
-    # Check if we have a pin mapping for this component
-    if ref in pin_maps and pin_name in pin_maps[ref]:
-        pin_num = pin_maps[ref][pin_name]
-    else:
-        # Assume pin_name is already the pin number
-        pin_num = pin_name
-
-    return ref, str(pin_num)
 
-
-def _auto_layout_components(components: Dict[str, Dict]) -> Dict[str, Tuple[float, float]]:
+def _auto_layout_components(components: Dict[str, ComponentSpec]) -> Dict[str, Tuple[float, float]]:
     """
     Automatically calculate component positions.
 
@@ -290,30 +516,80 @@ def _auto_layout_components(components: Dict[str, Dict]) -> Dict[str, Tuple[floa
     - Passive components (R, C, L) in the middle
     - Connectors on the right
     """
-    positions = {}
-
-    # Categorize components
+    # Categorize components in a single pass
     mcus = []
     passives = []
     others = []
 
     for ref, spec in components.items():
-        lib_id = spec.get('lib_id', '')
-        if any(x in lib_id for x in ['MCU', 'Module', 'IC']):
+        lib_id = spec.lib_id
+        if any(x in lib_id for x in _MCU_TOKENS):
             mcus.append(ref)
-        elif any(lib_id.startswith(f'Device:{x}') for x in ['R', 'C', 'L']):
+        elif lib_id.startswith(_PASSIVE_PREFIXES):
             passives.append(ref)
         else:
             others.append(ref)
 
-    # Position MCUs on the left
+    return _grid_layout_positions(mcus, passives, others)
+
+
+def _grid_layout_positions(
+    mcus: List[str],
+    passives: List[str],
+    others: List[str],
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Compute grid positions for pre-categorized components.
+
+    Uses vectorized NumPy arithmetic when available; otherwise falls back
+    to per-component Python loops.
+    """
+    positions = {}
     y_offset = 50.0
+    passive_x = 50.0 + (len(mcus) * COMPONENT_SPACING_X * 2) + COMPONENT_SPACING_X
+    other_x = passive_x + COMPONENT_SPACING_X * 2
+
+    if np is not None and numba is not None:
+        refs = mcus + passives + others
+        if not refs:
+            return positions
+        cat = np.array(
+            [0] * len(mcus) + [1] * len(passives) + [2] * len(others),
+            dtype=np.int64,
+        )
+        coords = _layout_kernel(
+            cat, len(mcus), COMPONENT_SPACING_X, COMPONENT_SPACING_Y
+        )
+        return dict(zip(refs, map(tuple, coords.tolist())))
+
+    if np is not None:
+        # MCUs on the left, in one row
+        if mcus:
+            x = 50.0 + np.arange(len(mcus)) * (COMPONENT_SPACING_X * 2)
+            coords = np.column_stack((x, np.full(len(mcus), y_offset)))
+            positions.update(zip(mcus, map(tuple, coords.tolist())))
+
+        # Passives in the middle, 4 per row
+        if passives:
+            idx = np.arange(len(passives))
+            x = passive_x + (idx % 4) * (COMPONENT_SPACING_X / 2)
+            y = y_offset + (idx // 4) * COMPONENT_SPACING_Y
+            coords = np.column_stack((x, y))
+            positions.update(zip(passives, map(tuple, coords.tolist())))
+
+        # Others on the right, in one column
+        if others:
+            y = y_offset + np.arange(len(others)) * COMPONENT_SPACING_Y
+            coords = np.column_stack((np.full(len(others), other_x), y))
+            positions.update(zip(others, map(tuple, coords.tolist())))
+
+        return positions
+
+    # Pure-Python fallback
     for i, ref in enumerate(mcus):
         x = 50.0 + (i * COMPONENT_SPACING_X * 2)
         positions[ref] = (x, y_offset)
 
-    # Position passives in the middle
-    passive_x = 50.0 + (len(mcus) * COMPONENT_SPACING_X * 2) + COMPONENT_SPACING_X
     for i, ref in enumerate(passives):
         row = i // 4
         col = i % 4
@@ -321,8 +597,6 @@ def _auto_layout_components(components: Dict[str, Dict]) -> Dict[str, Tuple[floa
         y = y_offset + (row * COMPONENT_SPACING_Y)
         positions[ref] = (x, y)
 
-    # Position others on the right
-    other_x = passive_x + COMPONENT_SPACING_X * 2
     for i, ref in enumerate(others):
         y = y_offset + (i * COMPONENT_SPACING_Y)
         positions[ref] = (other_x, y)
@@ -330,18 +604,341 @@ def _auto_layout_components(components: Dict[str, Dict]) -> Dict[str, Tuple[floa
     return positions
 
 
+def _layout_kernel(cat, n_mcu: int, sx: float, sy: float):
+    """
+    Compute grid positions for components given their category indices.
+
+    `cat` holds 0 (MCU), 1 (passive), or 2 (other) per component; the
+    result is an (N, 2) float64 array of positions in the same order.
+    Written as plain loops so Numba can lower it to machine code (see the
+    njit decoration below); the math matches _grid_layout_positions.
+    """
+    n = cat.shape[0]
+    out = np.empty((n, 2))
+    y_offset = 50.0
+    passive_x = 50.0 + n_mcu * sx * 2 + sx
+    other_x = passive_x + sx * 2
+    i_mcu = i_passive = i_other = 0
+    for i in range(n):
+        c = cat[i]
+        if c == 0:
+            out[i, 0] = 50.0 + i_mcu * sx * 2
+            out[i, 1] = y_offset
+            i_mcu += 1
+        elif c == 1:
+            out[i, 0] = passive_x + (i_passive % 4) * (sx / 2)
+            out[i, 1] = y_offset + (i_passive // 4) * sy
+            i_passive += 1
+        else:
+            out[i, 0] = other_x
+            out[i, 1] = y_offset + i_other * sy
+            i_other += 1
+    return out
+
+
+if numba is not None:
+    # cache=True persists the compiled kernel across runs
+    _layout_kernel = numba.njit(cache=True)(_layout_kernel)
+
+
+# Force-directed layout tuning (requires numpy)
+_FR_MAX_COMPONENTS = 200  # beyond this the O(N^2) force matrix gets expensive
+_FR_ITERATIONS = 50
+
+
+def _fr_layout(
+    components: Dict[str, ComponentSpec],
+    connections: List[Tuple[str, str]],
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Refine the grid layout with a vectorized Fruchterman-Reingold pass.
+
+    Builds a component adjacency matrix from the connection list, seeds
+    positions from _auto_layout_components, then iterates attraction along
+    wires and repulsion between all pairs with a cooling step size. Pins of
+    connected components end up near each other, so the manhattan router
+    has far fewer obstacles to plan around.
+    """
+    refs = list(components)
+    if not refs:
+        return {}
+    index = {ref: i for i, ref in enumerate(refs)}
+    n = len(refs)
+
+    # Adjacency from connections (refs are the part before the '.')
+    adj = np.zeros((n, n))
+    for src, dst in connections:
+        s = index.get(src.split('.', 1)[0])
+        d = index.get(dst.split('.', 1)[0])
+        if s is not None and d is not None and s != d:
+            adj[s, d] = adj[d, s] = 1.0
+
+    # Seed from the category grid so disconnected parts keep sane positions
+    seed = _auto_layout_components(components)
+    positions = np.array([seed.get(ref, (100.0, 100.0)) for ref in refs])
+
+    k = COMPONENT_SPACING_X  # ideal edge length (mm)
+    step = COMPONENT_SPACING_X / 2  # initial max displacement, cooled each pass
+    for _ in range(_FR_ITERATIONS):
+        delta = positions[:, None, :] - positions[None, :, :]
+        dist = np.linalg.norm(delta, axis=2) + 1e-9
+        rep = (k * k) / dist
+        attr = adj * dist * dist / k
+        force = (delta / dist[..., None]) * (rep - attr)[..., None]
+        disp = force.sum(axis=1)
+        length = np.linalg.norm(disp, axis=1) + 1e-9
+        positions += disp / length[:, None] * np.minimum(length, step)[:, None]
+        step *= 0.95
+
+    # Shift back into the sheet and snap to grid
+    positions += (50.0, 50.0) - positions.min(axis=0)
+    positions = np.round(positions / GRID_SPACING) * GRID_SPACING
+    return dict(zip(refs, map(tuple, positions.tolist())))
+
+
+# Clearance (mm) a bulk-routed wire keeps from component anchor points
+_ROUTE_CLEARANCE = COMPONENT_SPACING_Y
+
+
+def _route_all(sch, pending, positions):
+    """
+    Route many pin-to-pin wires against one shared obstacle index.
+
+    Component anchor positions are loaded into a single cKDTree that is
+    reused for every wire, instead of letting auto_route_pins rebuild its
+    obstacle map per call. Each wire gets an L-shaped manhattan route
+    checked for clearance against the tree; wires that cannot be routed
+    this way (or whose geometry cannot be submitted) are returned for the
+    caller's per-wire fallback chain.
+
+    Args:
+        sch: Schematic object
+        pending: List of (src, dst, (src_ref, src_pin), (dst_ref, dst_pin))
+        positions: Dict of component reference -> (x, y) anchor position
+
+    Returns:
+        The subset of `pending` left unrouted
+    """
+    centers = np.array(list(positions.values()), dtype=float)
+    if centers.size == 0:
+        return pending
+    tree = cKDTree(centers)
+
+    unrouted = []
+    for entry in pending:
+        _, _, (src_ref, src_pin), (dst_ref, dst_pin) = entry
+        try:
+            start = tuple(sch.get_component_pin_position(src_ref, src_pin))
+            end = tuple(sch.get_component_pin_position(dst_ref, dst_pin))
+            points = _manhattan_route(start, end, tree)
+            if points is None or not _add_wire_points(sch, points):
+                unrouted.append(entry)
+        except Exception:
+            # Degrade to the caller's per-wire fallback rather than letting
+            # a routing failure escape create_schematic
+            unrouted.append(entry)
+
+    return unrouted
+
+
+class _BucketQueue:
+    """
+    O(1) priority queue for small integer costs.
+
+    Manhattan A* on a uniform grid only ever produces small integer
+    f-costs, so a list of buckets indexed by cost avoids heapq's O(log n)
+    push/pop on the router's hottest data structure.
+    """
+
+    def __init__(self):
+        self._buckets: List[list] = []
+        self._min_idx = 0
+        self._size = 0
+
+    def push(self, cost: int, item) -> None:
+        while cost >= len(self._buckets):
+            self._buckets.append([])
+        self._buckets[cost].append(item)
+        if cost < self._min_idx:
+            self._min_idx = cost
+        self._size += 1
+
+    def pop(self):
+        """Remove and return (cost, item) with the lowest cost."""
+        buckets = self._buckets
+        while not buckets[self._min_idx]:
+            self._min_idx += 1
+        self._size -= 1
+        return self._min_idx, buckets[self._min_idx].pop()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+
+# Extra grid cells explored around the start/end bounding box before the
+# grid A* gives up on a wire
+_ASTAR_MARGIN = 10
+
+
+def _manhattan_route(start, end, tree):
+    """
+    Find a manhattan route from start to end clearing the obstacle tree.
+
+    Tries the two L-shaped routes (horizontal-then-vertical and
+    vertical-then-horizontal) first, then falls back to a grid A* search
+    driven by a bucket queue. Returns the polyline points, or None if no
+    route clears the obstacles.
+    """
+    if start == end:
+        # Coincident pins (duplicated refs, or components snapped onto the
+        # same grid cell) need no wire
+        return [start]
+    (x1, y1), (x2, y2) = start, end
+    for corner in ((x2, y1), (x1, y2)):
+        points = [start, corner, end]
+        # Collinear endpoints make the corner redundant
+        points = [p for i, p in enumerate(points) if i == 0 or p != points[i - 1]]
+        if _segments_clear(points, tree):
+            return points
+    return _grid_astar(start, end, tree)
+
+
+def _grid_astar(start, end, tree):
+    """
+    Manhattan A* over grid cells between start and end.
+
+    The search is bounded to the start/end bounding box plus
+    _ASTAR_MARGIN cells. Costs are integers (one per grid step), so the
+    open set is a _BucketQueue with O(1) push/pop. Cells within
+    _ROUTE_CLEARANCE of an obstacle are blocked, except near the wire's
+    own endpoints where pins necessarily sit on a component.
+
+    Returns:
+        Polyline points (corners only) from start to end, or None
+    """
+    to_cell = lambda p: (round(p[0] / GRID_SPACING), round(p[1] / GRID_SPACING))
+    to_point = lambda c: (c[0] * GRID_SPACING, c[1] * GRID_SPACING)
+    start_cell = to_cell(start)
+    end_cell = to_cell(end)
+
+    min_x = min(start_cell[0], end_cell[0]) - _ASTAR_MARGIN
+    max_x = max(start_cell[0], end_cell[0]) + _ASTAR_MARGIN
+    min_y = min(start_cell[1], end_cell[1]) - _ASTAR_MARGIN
+    max_y = max(start_cell[1], end_cell[1]) + _ASTAR_MARGIN
+
+    def blocked(cell):
+        point = to_point(cell)
+        if (abs(point[0] - start[0]) + abs(point[1] - start[1]) < _ROUTE_CLEARANCE
+                or abs(point[0] - end[0]) + abs(point[1] - end[1]) < _ROUTE_CLEARANCE):
+            return False
+        return bool(tree.query_ball_point(point, _ROUTE_CLEARANCE))
+
+    heuristic = lambda c: abs(c[0] - end_cell[0]) + abs(c[1] - end_cell[1])
+
+    open_set = _BucketQueue()
+    open_set.push(heuristic(start_cell), start_cell)
+    g_score = {start_cell: 0}
+    came_from = {}
+
+    while open_set:
+        _, cell = open_set.pop()
+        if cell == end_cell:
+            # Reconstruct, keeping only the corner points
+            path = [cell]
+            while cell in came_from:
+                cell = came_from[cell]
+                path.append(cell)
+            path.reverse()
+            points = [start]
+            for prev, cur, nxt in zip(path, path[1:], path[2:]):
+                if (nxt[0] - cur[0], nxt[1] - cur[1]) != (cur[0] - prev[0], cur[1] - prev[1]):
+                    points.append(to_point(cur))
+            points.append(end)
+            return [p for i, p in enumerate(points) if i == 0 or p != points[i - 1]]
+
+        g = g_score[cell]
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            neighbor = (cell[0] + dx, cell[1] + dy)
+            if not (min_x <= neighbor[0] <= max_x and min_y <= neighbor[1] <= max_y):
+                continue
+            tentative = g + 1
+            if tentative >= g_score.get(neighbor, float('inf')) or blocked(neighbor):
+                continue
+            g_score[neighbor] = tentative
+            came_from[neighbor] = cell
+            open_set.push(tentative + heuristic(neighbor), neighbor)
+
+    return None
+
+
+def _segments_clear(points, tree) -> bool:
+    """
+    Check that a polyline keeps _ROUTE_CLEARANCE from all obstacle points.
+
+    Samples each segment at grid pitch; samples near the polyline's own
+    endpoints are ignored, since pins necessarily sit on their component.
+    """
+    start, end = np.array(points[0]), np.array(points[-1])
+    samples = []
+    for (ax, ay), (bx, by) in zip(points, points[1:]):
+        steps = max(int(max(abs(bx - ax), abs(by - ay)) / GRID_SPACING), 1)
+        for t in np.linspace(0.0, 1.0, steps + 1):
+            samples.append((ax + (bx - ax) * t, ay + (by - ay) * t))
+
+    if not samples:
+        return True
+    samples = np.array(samples)
+    near_endpoint = (
+        (np.linalg.norm(samples - start, axis=1) < _ROUTE_CLEARANCE)
+        | (np.linalg.norm(samples - end, axis=1) < _ROUTE_CLEARANCE)
+    )
+    samples = samples[~near_endpoint]
+    if samples.size == 0:
+        return True
+    return not any(tree.query_ball_point(samples, _ROUTE_CLEARANCE))
+
+
+def _add_wire_points(sch, points) -> bool:
+    """
+    Submit a routed polyline, preferring whichever bulk API ksa exposes.
+
+    Returns:
+        True if the wire geometry was accepted
+    """
+    segments = list(zip(points, points[1:]))
+    try:
+        if hasattr(sch, 'add_wire_segments_bulk'):
+            sch.add_wire_segments_bulk(segments)
+        elif hasattr(sch, 'add_wire'):
+            for a, b in segments:
+                sch.add_wire(start=a, end=b)
+        else:
+            return False
+        return True
+    except Exception:
+        return False
+
+
 def _add_power_net(
     sch,
     pin_list: List[str],
     net_name: str,
-    pin_maps: Dict[str, Dict[str, str]]
+    resolved: Dict[str, Optional[Tuple[str, str]]]
 ):
-    """Add a power net connecting multiple pins with a net label."""
-    if not pin_list:
+    """
+    Add a power net connecting multiple pins with a net label.
+
+    `resolved` maps pin reference strings to pre-parsed (ref, pin_number)
+    tuples (None for references that failed to parse).
+    """
+    if not pin_list or resolved.get(pin_list[0]) is None:
         return
 
     # Add label at first pin position
-    first_ref, first_pin = _parse_pin_ref(pin_list[0], pin_maps)
+    first_ref, first_pin = resolved[pin_list[0]]
     try:
         pin_pos = sch.get_component_pin_position(first_ref, first_pin)
         # Offset label slightly
@@ -355,9 +952,11 @@ def _add_power_net(
     for i in range(len(pin_list) - 1):
         src = pin_list[i]
         dst = pin_list[i + 1]
+        if resolved.get(src) is None or resolved.get(dst) is None:
+            continue
+        src_ref, src_pin = resolved[src]
+        dst_ref, dst_pin = resolved[dst]
         try:
-            src_ref, src_pin = _parse_pin_ref(src, pin_maps)
-            dst_ref, dst_pin = _parse_pin_ref(dst, pin_maps)
             sch.add_wire_between_pins(src_ref, src_pin, dst_ref, dst_pin)
         except Exception as e:
             print(f"Warning: Could not connect power {src} -> {dst}: {e}")
@@ -382,27 +981,15 @@ def _render_svg(kicad_sch_path: str) -> Optional[str]:
             ['kicad-cli', 'sch', 'export', 'svg',
              '-o', output_dir,
              kicad_sch_path],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             timeout=30
         )
         if result.returncode == 0:
-            # KiCad 9 may create svg in a subdirectory, move it up if so
-            subdir_svg = os.path.join(output_dir, base_name + '.svg', base_name + '.svg')
-            if os.path.exists(subdir_svg):
-                shutil.move(subdir_svg, svg_path)
-                try:
-                    os.rmdir(os.path.dirname(subdir_svg))
-                except OSError:
-                    pass  # Directory not empty or already removed
-            # Also check if SVG was created directly
-            if not os.path.exists(svg_path):
-                direct_svg = os.path.join(output_dir, base_name + '.svg')
-                if os.path.isfile(direct_svg):
-                    return direct_svg
-            return svg_path
+            return _collect_svg(kicad_sch_path)
         else:
-            print(f"kicad-cli error: {result.stderr}")
+            # Only decode stderr on the failure path
+            print(f"kicad-cli error: {result.stderr.decode('utf-8', 'replace')}")
             return None
     except FileNotFoundError:
         print("Warning: kicad-cli not found. Install KiCad 9+ for SVG rendering.")
@@ -415,10 +1002,45 @@ def _render_svg(kicad_sch_path: str) -> Optional[str]:
         return None
 
 
+def _collect_svg(kicad_sch_path: str) -> str:
+    """
+    Locate the SVG produced by kicad-cli for a schematic and normalize its
+    location (KiCad 9 may create it inside a subdirectory; move it up).
+
+    Returns:
+        Path to the SVG file
+    """
+    output_dir = os.path.dirname(kicad_sch_path) or '.'
+    base_name = os.path.basename(kicad_sch_path).replace('.kicad_sch', '')
+    target = base_name + '.svg'
+    svg_path = os.path.join(output_dir, target)
+
+    # One readdir instead of separate exists/isfile stats per candidate
+    try:
+        entries = {e.name: e for e in os.scandir(output_dir)}
+    except OSError:
+        return svg_path
+
+    entry = entries.get(target)
+    if entry is not None and entry.is_dir():
+        # KiCad 9 may create the svg inside a subdirectory named like the
+        # file itself; move it out via a temp name so the rename onto the
+        # (now removed) directory's path can't collide
+        subdir_svg = os.path.join(output_dir, target, target)
+        tmp_svg = svg_path + '.part'
+        try:
+            shutil.move(subdir_svg, tmp_svg)
+            os.rmdir(os.path.dirname(subdir_svg))
+            os.replace(tmp_svg, svg_path)
+        except OSError as e:
+            print(f"Warning: Could not relocate rendered SVG: {e}")
+    return svg_path
+
+
 def _generate_connection_md(
     kicad_sch_path: str,
     title: Optional[str],
-    components: Dict[str, Dict[str, Any]],
+    components: Dict[str, ComponentSpec],
     connections: List[Tuple[str, str]],
     power_connections: Optional[List[Tuple[List[str], str]]] = None,
 ) -> Optional[str]:
@@ -439,61 +1061,75 @@ def _generate_connection_md(
     base_name = os.path.basename(kicad_sch_path).replace('.kicad_sch', '')
 
     try:
-        lines = []
+        # Write into a string buffer instead of accumulating a line list;
+        # avoids the join pass and a second full copy of the text
+        buf = io.StringIO()
+        w = buf.write
 
         # Title
-        lines.append(f"# {title or base_name}\n")
+        w(f"# {title or base_name}\n\n")
 
         # Component list
-        lines.append("## Components\n")
-        lines.append("| Reference | Type | Value |")
-        lines.append("|-----------|------|-------|")
+        w("## Components\n\n")
+        w("| Reference | Type | Value |\n")
+        w("|-----------|------|-------|\n")
         for ref, spec in components.items():
-            lib_id = spec.get('lib_id', 'Unknown')
-            value = spec.get('value', '')
+            lib_id = spec.lib_id or 'Unknown'
             # Extract component type from lib_id
             comp_type = lib_id.split(':')[-1] if ':' in lib_id else lib_id
-            lines.append(f"| {ref} | {comp_type} | {value} |")
-        lines.append("")
+            w(f"| {ref} | {comp_type} | {spec.value} |\n")
+        w("\n")
 
         # Connection table
-        lines.append("## Connections\n")
-        lines.append("| From | To | Net/Notes |")
-        lines.append("|------|-----|-----------|")
-
-        for src, dst in connections:
-            # Try to determine the signal type
-            signal_type = _infer_signal_type(src, dst)
-            lines.append(f"| {src} | {dst} | {signal_type} |")
-        lines.append("")
+        w("## Connections\n\n")
+        w("| From | To | Net/Notes |\n")
+        w("|------|-----|-----------|\n")
+
+        if np is not None and connections:
+            # Build all rows in one vectorized pass instead of per-row
+            # Python formatting
+            src_arr = np.array([c[0] for c in connections])
+            dst_arr = np.array([c[1] for c in connections])
+            sig_arr = np.vectorize(_infer_signal_type, otypes=[object])(
+                src_arr, dst_arr
+            ).astype(str)
+            rows = np.char.add(np.char.add('| ', src_arr), ' | ')
+            rows = np.char.add(np.char.add(rows, dst_arr), ' | ')
+            rows = np.char.add(np.char.add(rows, sig_arr), ' |')
+            w('\n'.join(rows.tolist()))
+            w('\n')
+        else:
+            for src, dst in connections:
+                # Try to determine the signal type
+                signal_type = _infer_signal_type(src, dst)
+                w(f"| {src} | {dst} | {signal_type} |\n")
+        w("\n")
 
         # Power connections
         if power_connections:
-            lines.append("## Power Nets\n")
-            lines.append("| Net | Connected Pins |")
-            lines.append("|-----|----------------|")
+            w("## Power Nets\n\n")
+            w("| Net | Connected Pins |\n")
+            w("|-----|----------------|\n")
             for pin_list, net_name in power_connections:
                 pins_str = ", ".join(pin_list)
-                lines.append(f"| {net_name} | {pins_str} |")
-            lines.append("")
+                w(f"| {net_name} | {pins_str} |\n")
+            w("\n")
 
         # Notes
-        lines.append("## Notes\n")
-        lines.append(f"- Schematic file: `{os.path.basename(kicad_sch_path)}`")
-        lines.append(f"- SVG render: `{base_name}.svg`")
+        w("## Notes\n\n")
+        w(f"- Schematic file: `{os.path.basename(kicad_sch_path)}`\n")
+        w(f"- SVG render: `{base_name}.svg`\n")
 
         # Add voltage level notes if MCUs detected
         mcu_refs = [ref for ref, spec in components.items()
-                    if any(x in spec.get('lib_id', '') for x in ['MCU', 'Module', 'Teensy', 'Arduino', 'Pico', 'ESP'])]
+                    if any(x in spec.lib_id for x in ['MCU', 'Module', 'Teensy', 'Arduino', 'Pico', 'ESP'])]
         if len(mcu_refs) >= 2:
-            lines.append("- Check voltage levels between MCUs (3.3V vs 5V logic)")
-            lines.append("- Add level shifters if needed for voltage compatibility")
-
-        lines.append("")
+            w("- Check voltage levels between MCUs (3.3V vs 5V logic)\n")
+            w("- Add level shifters if needed for voltage compatibility\n")
 
         # Write file
         with open(md_path, 'w') as f:
-            f.write('\n'.join(lines))
+            f.write(buf.getvalue())
 
         return md_path
 
@@ -553,12 +1189,42 @@ SIGNAL_PATTERNS = {
 }
 
 
+def _build_signal_automaton():
+    """
+    Build an Aho-Corasick automaton over SIGNAL_PATTERNS (if pyahocorasick
+    is installed).
+
+    The automaton scans a string once instead of doing one substring search
+    per keyword. Each keyword stores its position in SIGNAL_PATTERNS so that
+    earlier patterns keep priority over later ones, matching the original
+    loop order.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (keyword, signal_type) in enumerate(SIGNAL_PATTERNS.items()):
+        automaton.add_word(keyword, (priority, signal_type))
+    automaton.make_automaton()
+    return automaton
+
+
+_SIGNAL_AUTOMATON = _build_signal_automaton()
+
+# Snapshot of SIGNAL_PATTERNS for the non-automaton path: iterating a tuple
+# of pairs is cheaper than dict.items() in the per-connection loop
+_SIGNAL_ITEMS = tuple(SIGNAL_PATTERNS.items())
+
+
+@functools.lru_cache(maxsize=4096)
 def _infer_signal_type(src: str, dst: str) -> str:
     """
     Infer the signal type from pin names.
 
-    Uses SIGNAL_PATTERNS dict for keyword matching.
-    Add custom patterns to SIGNAL_PATTERNS to extend detection.
+    Uses SIGNAL_PATTERNS dict for keyword matching, scanned in a single pass
+    via Aho-Corasick when pyahocorasick is available. Results are memoized:
+    bus wires repeat the same (src, dst) names many times per schematic.
+    Add custom patterns to SIGNAL_PATTERNS to extend detection, then call
+    clear_signal_cache() so they take effect.
     """
     src_upper = src.upper()
     dst_upper = dst.upper()
@@ -588,14 +1254,105 @@ def _infer_signal_type(src: str, dst: str) -> str:
     if ('TX' in src_upper and 'RX' in dst_upper) or ('RX' in src_upper and 'TX' in dst_upper):
         return "UART"
 
-    # Check against pattern dictionary
-    for keyword, signal_type in SIGNAL_PATTERNS.items():
+    # Check against pattern dictionary: one automaton scan if available,
+    # otherwise fall back to a substring search per keyword
+    if _SIGNAL_AUTOMATON is not None:
+        best = None
+        for _, (priority, signal_type) in _SIGNAL_AUTOMATON.iter(combined):
+            if best is None or priority < best[0]:
+                best = (priority, signal_type)
+        if best is not None:
+            return best[1]
+        return ""
+
+    for keyword, signal_type in _SIGNAL_ITEMS:
         if keyword in combined:
             return signal_type
 
     return ""
 
 
+def clear_signal_cache():
+    """
+    Rebuild signal-inference state after mutating SIGNAL_PATTERNS.
+
+    Drops the memoized _infer_signal_type results and recompiles the
+    automaton and pattern snapshot so newly added patterns take effect.
+    """
+    global _SIGNAL_AUTOMATON, _SIGNAL_ITEMS
+    _SIGNAL_AUTOMATON = _build_signal_automaton()
+    _SIGNAL_ITEMS = tuple(SIGNAL_PATTERNS.items())
+    _infer_signal_type.cache_clear()
+
+
+@functools.lru_cache(maxsize=128)
+def _build_mcu_topology(
+    mcu1_name: str,
+    mcu1_lib_id: str,
+    mcu1_pins: Tuple[Tuple[str, str], ...],
+    mcu2_name: str,
+    mcu2_lib_id: str,
+    mcu2_pins: Tuple[Tuple[str, str], ...],
+    connections: Tuple[Tuple[str, str], ...],
+    i2c_pins: Tuple[str, ...],
+    pullup_value: str,
+):
+    """
+    Build (components, connections, power_connections) for the fixed
+    2-MCU + pullup topology.
+
+    The topology is fully determined by these arguments (all hashable so
+    the result is memoized), which makes repeated draw_mcu_connection
+    calls over design variants skip the per-connection loop and pullup
+    bookkeeping entirely.
+    """
+    # Build component dict
+    components = {
+        mcu1_name: {
+            'lib_id': mcu1_lib_id,
+            'value': mcu1_lib_id.split(':')[-1],
+            'pins': dict(mcu1_pins),
+        },
+        mcu2_name: {
+            'lib_id': mcu2_lib_id,
+            'value': mcu2_lib_id.split(':')[-1],
+            'pins': dict(mcu2_pins),
+        },
+    }
+
+    # Build connection list, adding pullup resistors for I2C
+    full_connections = []
+    power_connections = []
+    pullup_count = 0
+    processed_i2c_pins = set()  # Track which I2C pins already have pullups
+
+    for mcu1_pin, mcu2_pin in connections:
+        # Direct connection between MCUs
+        full_connections.append((f'{mcu1_name}.{mcu1_pin}', f'{mcu2_name}.{mcu2_pin}'))
+
+        # Add pullup resistor for I2C lines (once per signal line)
+        i2c_signal = None
+        if mcu1_pin in i2c_pins:
+            i2c_signal = mcu1_pin
+        elif mcu2_pin in i2c_pins:
+            i2c_signal = mcu2_pin
+
+        if i2c_signal and i2c_signal not in processed_i2c_pins:
+            processed_i2c_pins.add(i2c_signal)
+            pullup_count += 1
+            r_ref = f'R{pullup_count}'
+            components[r_ref] = {
+                'lib_id': 'Device:R',
+                'value': pullup_value,
+            }
+            # Pullup: R.1 connects to signal line, R.2 goes to VCC
+            full_connections.append((f'{mcu1_name}.{mcu1_pin}', f'{r_ref}.1'))
+            # Collect pullup resistor pins for VCC connection
+            power_connections.append(([f'{r_ref}.2'], 'VCC'))
+
+    return components, full_connections, power_connections
+
+
 # Convenience function for simple 2-component diagrams
 def draw_mcu_connection(
     mcu1_name: str,
@@ -646,51 +1403,13 @@ def draw_mcu_connection(
             filename='teensy_rp2040.kicad_sch'
         )
     """
-    i2c_pins = i2c_pins or []
-
-    # Build component dict
-    components = {
-        mcu1_name: {
-            'lib_id': mcu1_lib_id,
-            'value': mcu1_lib_id.split(':')[-1],
-            'pins': mcu1_pins,
-        },
-        mcu2_name: {
-            'lib_id': mcu2_lib_id,
-            'value': mcu2_lib_id.split(':')[-1],
-            'pins': mcu2_pins,
-        },
-    }
-
-    # Build connection list, adding pullup resistors for I2C
-    full_connections = []
-    power_connections = []
-    pullup_count = 0
-    processed_i2c_pins = set()  # Track which I2C pins already have pullups
-
-    for mcu1_pin, mcu2_pin in connections:
-        # Direct connection between MCUs
-        full_connections.append((f'{mcu1_name}.{mcu1_pin}', f'{mcu2_name}.{mcu2_pin}'))
-
-        # Add pullup resistor for I2C lines (once per signal line)
-        i2c_signal = None
-        if mcu1_pin in i2c_pins:
-            i2c_signal = mcu1_pin
-        elif mcu2_pin in i2c_pins:
-            i2c_signal = mcu2_pin
-
-        if i2c_signal and i2c_signal not in processed_i2c_pins:
-            processed_i2c_pins.add(i2c_signal)
-            pullup_count += 1
-            r_ref = f'R{pullup_count}'
-            components[r_ref] = {
-                'lib_id': 'Device:R',
-                'value': pullup_value,
-            }
-            # Pullup: R.1 connects to signal line, R.2 goes to VCC
-            full_connections.append((f'{mcu1_name}.{mcu1_pin}', f'{r_ref}.1'))
-            # Collect pullup resistor pins for VCC connection
-            power_connections.append(([f'{r_ref}.2'], 'VCC'))
+    # The topology only depends on hashable inputs, so delegate to the
+    # memoized builder (pin maps and lists are passed as tuples)
+    components, full_connections, power_connections = _build_mcu_topology(
+        mcu1_name, mcu1_lib_id, tuple(mcu1_pins.items()),
+        mcu2_name, mcu2_lib_id, tuple(mcu2_pins.items()),
+        tuple(connections), tuple(i2c_pins or []), pullup_value,
+    )
 
     return create_schematic(
         components=components,